@@ -73,8 +73,11 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # Same settings-derived URL as offline mode (alembic.ini only has a placeholder)
+    section = config.get_section(config.config_ini_section, {})
+    section["sqlalchemy.url"] = get_sync_db_url()
     connectable = engine_from_config(
-        config.get_section(config.config_ini_section, {}),
+        section,
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
     )
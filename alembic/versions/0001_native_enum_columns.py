@@ -0,0 +1,124 @@
+"""Convert status/source/condition columns from VARCHAR to native enums
+
+Databases created before the enum switch still have VARCHAR(20) columns, and
+create_all() never alters existing tables. Fresh databases built by
+create_all() already have the enum columns; those are left untouched.
+
+Revision ID: 0001_native_enum_columns
+Revises:
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_native_enum_columns"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Labels are frozen here on purpose: later enum changes get their own revision
+ENUM_TYPES = {
+    "cycle_status": ("ACTIVE", "LOCKED"),
+    "verification_source": ("SELF", "AUDITOR", "OVERRIDDEN"),
+    "verification_status": ("VERIFIED", "DISCREPANCY", "NOT_FOUND", "NEW_ASSET"),
+    "asset_condition": ("GOOD", "DAMAGED", "NEEDS_REPAIR"),
+}
+
+# (table, column, enum type, server default)
+ENUM_COLUMNS = (
+    ("verification_cycles", "status", "cycle_status", "ACTIVE"),
+    ("asset_verifications", "source", "verification_source", None),
+    ("asset_verifications", "status", "verification_status", None),
+    ("asset_verifications", "condition", "asset_condition", None),
+)
+
+
+def _column_types(bind, table: str) -> dict:
+    inspector = sa.inspect(bind)
+    if not inspector.has_table(table):
+        return {}
+    return {column["name"]: column["type"] for column in inspector.get_columns(table)}
+
+
+def _check_enum_values(bind) -> None:
+    """Fail with a readable list of rows the USING casts below would reject
+
+    NewAssetCreate accepted any string for source/status before the enum
+    switch, so older databases can hold values outside the labels.
+    """
+    problems = []
+    for table, column, enum_name, _ in ENUM_COLUMNS:
+        current = _column_types(bind, table).get(column)
+        if current is None or isinstance(current, sa.Enum):
+            continue
+        rows = bind.execute(
+            sa.text(
+                f"SELECT id, {column} FROM {table} "
+                f"WHERE {column} IS NOT NULL AND {column} NOT IN :labels ORDER BY id"
+            ).bindparams(sa.bindparam("labels", expanding=True)),
+            {"labels": list(ENUM_TYPES[enum_name])},
+        ).all()
+        problems.extend(f"  {table}.{column} id={row_id}: {value!r}" for row_id, value in rows)
+
+    if problems:
+        raise RuntimeError(
+            "Rows hold values outside the new enum labels; fix or delete them "
+            "and re-run the upgrade:\n" + "\n".join(problems)
+        )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    _check_enum_values(bind)
+
+    for name, labels in ENUM_TYPES.items():
+        postgresql.ENUM(*labels, name=name).create(bind, checkfirst=True)
+
+    for table, column, enum_name, server_default in ENUM_COLUMNS:
+        current = _column_types(bind, table).get(column)
+        if current is None or isinstance(current, sa.Enum):
+            continue  # table not created yet, or already converted
+
+        # The old VARCHAR default can't be cast automatically; drop and re-add it
+        if server_default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {enum_name} USING {column}::{enum_name}"
+        )
+        if server_default is not None:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"SET DEFAULT '{server_default}'::{enum_name}"
+            )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    for table, column, enum_name, server_default in ENUM_COLUMNS:
+        current = _column_types(bind, table).get(column)
+        if current is None or not isinstance(current, sa.Enum):
+            continue
+
+        if server_default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE VARCHAR(20) USING {column}::text"
+        )
+        if server_default is not None:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"SET DEFAULT '{server_default}'"
+            )
+
+    for name in ENUM_TYPES:
+        postgresql.ENUM(name=name).drop(bind, checkfirst=True)
@@ -0,0 +1,32 @@
+"""Index assets.owner_id
+
+create_all() only builds ix_assets_owner_id for new tables; databases created
+before the index was added to the model need it created here.
+
+Revision ID: 0002_assets_owner_id_index
+Revises: 0001_native_enum_columns
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_assets_owner_id_index"
+down_revision: Union[str, None] = "0001_native_enum_columns"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("assets"):
+        return  # table not created yet; create_all() will add the index
+
+    op.create_index("ix_assets_owner_id", "assets", ["owner_id"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_assets_owner_id", table_name="assets", if_exists=True)
@@ -1,6 +1,8 @@
 # api/route1/db_manager.py
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from db_models.enums import CycleStatus
 from db_models.verification_cycle import VerificationCycle
 from . import queries
 
@@ -14,15 +16,15 @@ async def create_cycle(db: AsyncSession, tag: str) -> VerificationCycle:
     if existing is not None:
         raise ValueError("Cycle with this tag already exists")
 
-    cycle = VerificationCycle(tag=tag, status="ACTIVE")
+    cycle = VerificationCycle(tag=tag, status=CycleStatus.ACTIVE)
     db.add(cycle)
     await db.commit()
     await db.refresh(cycle)
     return cycle
 
 
-async def list_cycles(db: AsyncSession) -> list[VerificationCycle]:
-    """Return all cycles ordered by created_at desc."""
+async def list_cycles(db: AsyncSession) -> list[Row]:
+    """Return all cycles ordered by created_at desc, as column rows."""
     stmt = queries.select_all_cycles()
     result = await db.execute(stmt)
-    return list(result.scalars().all())
+    return list(result.all())
@@ -10,5 +10,14 @@ def select_cycle_by_tag(tag: str):
 
 
 def select_all_cycles():
-    """Select all cycles ordered by creation time (newest first)."""
-    return select(VerificationCycle).order_by(VerificationCycle.created_at.desc())
+    """Select all cycle columns ordered by creation time (newest first).
+
+    Returns plain rows rather than ORM instances; the list endpoint is read-only.
+    """
+    return select(
+        VerificationCycle.id,
+        VerificationCycle.tag,
+        VerificationCycle.status,
+        VerificationCycle.created_at,
+        VerificationCycle.locked_at,
+    ).order_by(VerificationCycle.created_at.desc())
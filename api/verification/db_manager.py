@@ -1,10 +1,12 @@
 # api/verification/db_manager.py
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from db_models.asset import Asset
 from db_models.verification_cycle import VerificationCycle
 from db_models.asset_verification import AssetVerification
+from db_models.enums import VerificationSource, VerificationStatus
 from . import queries
 
 
@@ -59,10 +61,10 @@ async def lookup_asset_for_cycle(
 
     return asset, effective, already_verified
 
-async def search_assets(db: AsyncSession, query_text: str) -> list[Asset]:
+async def search_assets(db: AsyncSession, query_text: str) -> list[Row]:
     stmt = queries.search_assets_query(query_text)
     result = await db.execute(stmt)
-    return list(result.scalars().all())
+    return list(result.all())
 
 
 class CycleNotFoundError(Exception):
@@ -90,8 +92,8 @@ async def create_asset_and_initial_verification(
     *,
     owner_hint: str | None = None,
     performed_by: str | None = None,
-    source: str = "AUDITOR",
-    status: str = "NEW_ASSET",
+    source: VerificationSource = VerificationSource.AUDITOR,
+    status: VerificationStatus = VerificationStatus.NEW_ASSET,
     photos: list[str] | None = None,
     location_lat: float | None = None,
     location_lng: float | None = None,
@@ -3,6 +3,8 @@ from datetime import datetime
 from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 
+from db_models.enums import VerificationSource, VerificationStatus
+
 
 class AssetSummary(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -62,10 +64,10 @@ class NewAssetCreate(BaseModel):
     performed_by: Optional[str] = None
 
     # Source who discovered it: 'AUDITOR' or 'SELF' (default AUDITOR)
-    source: Optional[str] = "AUDITOR"
+    source: Optional[VerificationSource] = VerificationSource.AUDITOR
 
     # Initial status for the asset verification (default NEW_ASSET)
-    status: Optional[str] = "NEW_ASSET"
+    status: Optional[VerificationStatus] = VerificationStatus.NEW_ASSET
 
     # Optional verification metadata
     photos: Optional[List[str]] = None
@@ -32,9 +32,11 @@ def select_verifications_for_asset_cycle(asset_id: int, cycle_id: int):
 from db_models.asset import Asset
 
 def search_assets_query(text: str):
+    # Column-only select: rows come back as lightweight Row tuples instead of
+    # identity-mapped ORM instances, which is all the search response needs.
     pattern = f"%{text.lower()}%"
     return (
-        select(Asset)
+        select(Asset.id, Asset.asset_code, Asset.name, Asset.is_active)
         .where(
             or_(
                 func.lower(Asset.asset_code).like(pattern),
@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db import get_session
+from db_models.enums import VerificationSource, VerificationStatus
 from .models import AssetLookupResponse, AssetSummary, VerificationSummary,SearchAssetResponse, SearchAssetResult,NewAssetCreate, NewAssetResponse 
 from . import db_manager
 
@@ -100,8 +101,8 @@ async def create_new_asset_endpoint(
             cycle_id=payload.cycle_id,
             owner_hint=payload.owner_hint,
             performed_by=payload.performed_by,
-            source=payload.source or "AUDITOR",
-            status=payload.status or "NEW_ASSET",
+            source=payload.source or VerificationSource.AUDITOR,
+            status=payload.status or VerificationStatus.NEW_ASSET,
             photos=payload.photos,
             location_lat=payload.location_lat,
             location_lng=payload.location_lng,
@@ -10,9 +10,16 @@ with engine.connect() as conn:
     print("DATABASE CONTENTS")
     print("=" * 60)
 
+    # All three table counts in one round-trip
+    asset_count, cycle_count, verification_count = conn.execute(text("""
+        SELECT
+            (SELECT COUNT(*) FROM assets),
+            (SELECT COUNT(*) FROM verification_cycles),
+            (SELECT COUNT(*) FROM asset_verifications)
+    """)).one()
+
     # Check Assets
-    result = conn.execute(text("SELECT COUNT(*) FROM assets"))
-    print(f"\nAssets: {result.scalar()}")
+    print(f"\nAssets: {asset_count}")
 
     result = conn.execute(text("SELECT asset_code, name, is_active FROM assets ORDER BY asset_code"))
     for row in result:
@@ -20,8 +27,7 @@ with engine.connect() as conn:
         print(f"  {row[0]}: {row[1]} ({status})")
 
     # Check Verification Cycles
-    result = conn.execute(text("SELECT COUNT(*) FROM verification_cycles"))
-    print(f"\nVerification Cycles: {result.scalar()}")
+    print(f"\nVerification Cycles: {cycle_count}")
 
     result = conn.execute(text("SELECT id, tag, status, locked_at FROM verification_cycles ORDER BY created_at"))
     for row in result:
@@ -29,8 +35,7 @@ with engine.connect() as conn:
         print(f"  {row[0]}. {row[1]} - {row[2]}")
 
     # Check Asset Verifications
-    result = conn.execute(text("SELECT COUNT(*) FROM asset_verifications"))
-    print(f"\nAsset Verifications: {result.scalar()}")
+    print(f"\nAsset Verifications: {verification_count}")
 
     result = conn.execute(text("""
         SELECT
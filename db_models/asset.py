@@ -22,8 +22,10 @@ class Asset(Base):
         nullable=False,
     )
 
+    # Plain integer for now; becomes a FK once a users table exists
     owner_id: Mapped[int | None] = mapped_column(
         nullable=True,
+        index=True,
     )
 
     is_active: Mapped[bool] = mapped_column(
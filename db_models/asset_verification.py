@@ -4,6 +4,7 @@ from datetime import datetime
 from sqlalchemy import (
     String,
     DateTime,
+    Enum as SAEnum,
     Float,
     Text,
     ForeignKey,
@@ -13,6 +14,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db_base import Base
 from db_models.asset import Asset
+from db_models.enums import AssetCondition, VerificationSource, VerificationStatus
 from db_models.verification_cycle import VerificationCycle
 
 
@@ -39,21 +41,21 @@ class AssetVerification(Base):
         nullable=True,
     )
 
-    # Source: SELF / AUDITOR / OVERRIDDEN
-    source: Mapped[str] = mapped_column(
-        String(20),
+    # Source: SELF / AUDITOR / OVERRIDDEN (native PG enum)
+    source: Mapped[VerificationSource] = mapped_column(
+        SAEnum(VerificationSource, name="verification_source"),
         nullable=False,
     )
 
-    # Status: VERIFIED / DISCREPANCY / NOT_FOUND / NEW_ASSET
-    status: Mapped[str] = mapped_column(
-        String(20),
+    # Status: VERIFIED / DISCREPANCY / NOT_FOUND / NEW_ASSET (native PG enum)
+    status: Mapped[VerificationStatus] = mapped_column(
+        SAEnum(VerificationStatus, name="verification_status"),
         nullable=False,
     )
 
-    # Condition: GOOD / DAMAGED / NEEDS_REPAIR
-    condition: Mapped[str | None] = mapped_column(
-        String(20),
+    # Condition: GOOD / DAMAGED / NEEDS_REPAIR (native PG enum)
+    condition: Mapped[AssetCondition | None] = mapped_column(
+        SAEnum(AssetCondition, name="asset_condition"),
         nullable=True,
     )
 
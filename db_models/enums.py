@@ -0,0 +1,26 @@
+# db_models/enums.py
+import enum
+
+
+class CycleStatus(enum.StrEnum):
+    ACTIVE = "ACTIVE"
+    LOCKED = "LOCKED"
+
+
+class VerificationSource(enum.StrEnum):
+    SELF = "SELF"
+    AUDITOR = "AUDITOR"
+    OVERRIDDEN = "OVERRIDDEN"
+
+
+class VerificationStatus(enum.StrEnum):
+    VERIFIED = "VERIFIED"
+    DISCREPANCY = "DISCREPANCY"
+    NOT_FOUND = "NOT_FOUND"
+    NEW_ASSET = "NEW_ASSET"
+
+
+class AssetCondition(enum.StrEnum):
+    GOOD = "GOOD"
+    DAMAGED = "DAMAGED"
+    NEEDS_REPAIR = "NEEDS_REPAIR"
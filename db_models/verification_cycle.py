@@ -1,10 +1,11 @@
 # db_models/verification_cycle.py
 from datetime import datetime
 
-from sqlalchemy import String, DateTime, func
+from sqlalchemy import String, DateTime, Enum as SAEnum, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db_base import Base
+from db_models.enums import CycleStatus
 
 
 class VerificationCycle(Base):
@@ -19,10 +20,11 @@ class VerificationCycle(Base):
         nullable=False,
     )
 
-    status: Mapped[str] = mapped_column(
-        String(20),
+    # Status: ACTIVE / LOCKED (native PG enum)
+    status: Mapped[CycleStatus] = mapped_column(
+        SAEnum(CycleStatus, name="cycle_status"),
         nullable=False,
-        default="ACTIVE",
+        default=CycleStatus.ACTIVE,
         server_default="ACTIVE",
     )
 
@@ -27,3 +27,12 @@ app.add_middleware(
 
 app.include_router(cycles_router, prefix="/api/v1")
 app.include_router(verification_router, prefix="/api/v1")
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # httptools comes with uvicorn[standard]. loop="auto" picks uvloop where it
+    # is installed (not on Windows, which uvloop doesn't support) and falls
+    # back to the stock asyncio loop otherwise.
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, loop="auto", http="httptools")
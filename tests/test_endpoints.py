@@ -1,9 +1,7 @@
-import os
-import csv
 import pytest
-from db_models.asset import Asset
-from db_models.verification_cycle import VerificationCycle
-from db_models.asset_verification import AssetVerification
+
+LOOKUP_URL = "/api/v1/verification/assets/lookup"
+SEARCH_URL = "/api/v1/verification/assets/search"
 
 @pytest.mark.anyio
 async def test_create_and_list_cycle(async_client):
@@ -17,23 +15,21 @@ async def test_create_and_list_cycle(async_client):
     resp = await async_client.get("/api/v1/cycles")
     assert resp.status_code == 200, resp.text
     items = resp.json()
-    assert any(item["id"] == cycle_id for item in items)
+    assert cycle_id in {item["id"] for item in items}
 
 @pytest.mark.anyio
-async def test_lookup_asset_not_found(async_client):
+async def test_lookup_asset_not_found(async_client, cycles):
     """Test looking up an asset that doesn't exist"""
-    resp = await async_client.post("/api/v1/cycles", json={"tag":"TEST-CYCLE-LOOKUP"})
-    assert resp.status_code == 201
-    cycle_id = resp.json()["id"]
+    cycle_id = cycles["TEST-CYCLE-LOOKUP"]
 
     # Try to lookup a non-existent asset
-    resp = await async_client.get(f"/api/v1/verification/assets/lookup?asset_code=NOPE&cycle_id={cycle_id}")
+    resp = await async_client.get(LOOKUP_URL, params={"asset_code": "NOPE", "cycle_id": cycle_id})
     assert resp.status_code == 200
     body = resp.json()
     assert body["not_found"] is True
 
     # Verify we can lookup an existing asset from CSV
-    resp = await async_client.get(f"/api/v1/verification/assets/lookup?asset_code=AST001&cycle_id={cycle_id}")
+    resp = await async_client.get(LOOKUP_URL, params={"asset_code": "AST001", "cycle_id": cycle_id})
     assert resp.status_code == 200
     body = resp.json()
     assert body["not_found"] is False
@@ -41,14 +37,12 @@ async def test_lookup_asset_not_found(async_client):
     assert "Laptop" in body["asset"]["name"]
 
 @pytest.mark.anyio
-async def test_search_and_new_asset_flow(async_client):
+async def test_search_and_new_asset_flow(async_client, cycles):
     """Test searching for assets and creating new ones"""
-    resp = await async_client.post("/api/v1/cycles", json={"tag":"TEST-CYCLE-SEARCH"})
-    assert resp.status_code == 201
-    cycle_id = resp.json()["id"]
+    cycle_id = cycles["TEST-CYCLE-SEARCH"]
 
     # Search for "lap" should find "Dell Laptop" from seeded data
-    resp = await async_client.get("/api/v1/verification/assets/search?q=lap")
+    resp = await async_client.get(SEARCH_URL, params={"q": "lap"})
     assert resp.status_code == 200
     results = resp.json()["results"]
     assert isinstance(results, list)
@@ -78,8 +72,27 @@ async def test_search_and_new_asset_flow(async_client):
     assert "verification_id" in data
 
     # Verify the new asset can be looked up
-    resp = await async_client.get(f"/api/v1/verification/assets/lookup?asset_code=TEST-NEW-001&cycle_id={cycle_id}")
+    resp = await async_client.get(LOOKUP_URL, params={"asset_code": "TEST-NEW-001", "cycle_id": cycle_id})
     assert resp.status_code == 200
     body = resp.json()
     assert body["not_found"] is False
     assert body["already_verified"] is True
+
+@pytest.mark.anyio
+async def test_new_asset_rejects_unknown_enum_values(async_client, cycles):
+    """source/status are validated against the enums before anything is written"""
+    base_payload = {
+        "asset_code": "TEST-NEW-BAD",
+        "name": "Test Bad Enum Asset",
+        "cycle_id": cycles["TEST-CYCLE-SEARCH"],
+    }
+
+    for field in ("source", "status"):
+        resp = await async_client.post("/api/v1/verification/assets/new", json={**base_payload, field: "BOGUS"})
+        assert resp.status_code == 422, resp.text
+        assert any(error["loc"][-1] == field for error in resp.json()["detail"])
+
+    # Nothing was created by the rejected requests
+    resp = await async_client.get(LOOKUP_URL, params={"asset_code": "TEST-NEW-BAD", "cycle_id": base_payload["cycle_id"]})
+    assert resp.status_code == 200
+    assert resp.json()["not_found"] is True